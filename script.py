@@ -1,11 +1,34 @@
 import os
+import json
+import errno
 import logging
+import logging.handlers
 import time
+import mmap
+import stat
 import shutil
 import hashlib
+import tempfile
 import argparse
+import contextlib
+import threading
+import queue
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; reflinks are Linux-only here
+    fcntl = None
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # watchdog is optional, only needed for --watch
+    Observer = None
+    FileSystemEventHandler = object
 
 """
 Parameters:
@@ -16,9 +39,146 @@ Parameters:
 - log_path: Path to the log file
 """
 
+# Fingerprint index of replica files, kept in the replica root
+CACHE_FILE_NAME = ".folder_sync_cache.json"
+# Content digest used for file comparison; only equality matters, so the fastest
+# hardware-accelerated algorithm is preferred
+HASH_ALGORITHM = "sha256"
+# File digests are composite: the hash of the concatenated digests of consecutive
+# HASH_RANGE_SIZE ranges, so the ranges of a large file can be hashed in parallel
+HASH_RANGE_SIZE = 64 << 20
+HASH_FORMAT = f"{HASH_ALGORITHM}-ranges-{HASH_RANGE_SIZE}"
+HASH_THREADS = min(8, os.cpu_count() or 1)
+# Read size for hashing and comparing files
+CHUNK_SIZE = 1 << 20
+# Files above this size are updated by rewriting only their changed blocks into a reflink of the replica
+# where its filesystem supports one; below it a full copy is cheaper than comparing
+DELTA_THRESHOLD = 1 << 20
+DELTA_BLOCK_SIZE = 4096
+# Bytes requested per os.copy_file_range call, and the errors on which it falls back
+# to a userspace copy (cross-device on old kernels, unsupported filesystems)
+COPY_RANGE_SIZE = 1 << 30
+COPY_RANGE_FALLBACK_ERRNOS = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM)
+# ioctl(FICLONE) creates a copy-on-write clone (btrfs, XFS, ...) in O(1); errors meaning
+# the filesystem or device pair does not support it disable it for the rest of the iteration
+FICLONE = 0x40049409
+REFLINK_FALLBACK_ERRNOS = (errno.EXDEV, errno.EOPNOTSUPP, errno.EINVAL, errno.ENOTTY, errno.ENOSYS)
+# Full copies of files above this size bypass the page cache with O_DIRECT, using
+# page-aligned buffers; the data would only evict more useful cached pages
+DIRECT_IO_THRESHOLD = 128 << 20
+DIRECT_IO_CHUNK_SIZE = 4 << 20
+DIRECT_IO_ALIGNMENT = 4096
+# Syncing is I/O-bound, so use more worker threads than cores
+DEFAULT_THREADS = min(32, (os.cpu_count() or 1) * 4)
+# Worker processes used for full syncs; 1 syncs everything in this process
+DEFAULT_PROCESSES = 1
+# In watch mode, every Nth iteration still walks the whole tree as a safety net
+FULL_SYNC_EVERY = 10
+
+
+def fadvise(files: tuple, advice: str, offset: int = 0, length: int = 0) -> None:
+    """
+    Give the kernel an access pattern hint (an os.POSIX_FADV_* name) for open files,
+    where posix_fadvise is available
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for f in files:
+        try:
+            os.posix_fadvise(f.fileno(), offset, length, getattr(os, advice))
+        except OSError:
+            pass
+
+
+@contextlib.contextmanager
+def sequential_read(*files, offset: int = 0, length: int = 0) -> Iterator[None]:
+    """
+    Ask for aggressive readahead on files read once from start to end, and drop
+    their pages from the page cache afterwards so one-shot sync reads do not evict other data
+    """
+    fadvise(files, "POSIX_FADV_SEQUENTIAL", offset, length)
+    try:
+        yield
+    finally:
+        fadvise(files, "POSIX_FADV_DONTNEED", offset, length)
+
+
+@contextlib.contextmanager
+def replacement_file(target_file: Union[Path, str]) -> Iterator[str]:
+    """
+    Yield a uniquely named temporary path next to a file to build its new contents in,
+    then atomically replace the file with it. The temporary file is removed on failure
+    """
+    parent, name = os.path.split(os.fspath(target_file))
+    fd, tmp = tempfile.mkstemp(dir=parent or ".", prefix="." + name + ".", suffix=".tmp")
+    os.close(fd)
+    try:
+        yield tmp
+        os.replace(tmp, target_file)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+class RangeHash:
+    """
+    Incrementally compute the composite HASH_FORMAT digest of a stream
+    """
+
+    def __init__(self) -> None:
+        self.range_digests = []
+        self.current = None
+        self.remaining = 0
+
+    def update(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            if not self.remaining:
+                self._finish_range()
+                self.current = hashlib.new(HASH_ALGORITHM)
+                self.remaining = HASH_RANGE_SIZE
+            part = view[:self.remaining]
+            self.current.update(part)
+            self.remaining -= len(part)
+            view = view[len(part):]
+
+    def _finish_range(self) -> None:
+        if self.current is not None:
+            self.range_digests.append(self.current.digest())
+            self.current = None
+
+    def hexdigest(self) -> str:
+        self._finish_range()
+        self.remaining = 0
+        return hashlib.new(HASH_ALGORITHM, b"".join(self.range_digests)).hexdigest()
+
+
+class ChangeCollector(FileSystemEventHandler):
+    """
+    Collect the source paths reported by filesystem events into a queue as
+    (path, rescan) pairs, where rescan marks a directory whose whole subtree is new
+    """
+
+    def __init__(self, changes: queue.Queue) -> None:
+        super().__init__()
+        self.changes = changes
+
+    def on_any_event(self, event) -> None:
+        if event.event_type in ("opened", "closed_no_write"):
+            return
+        if event.is_directory and event.event_type == "modified":
+            # Entries added to or removed from the directory report their own events
+            return
+        self.changes.put(
+            (event.src_path, event.is_directory and event.event_type == "created"))
+        if getattr(event, "dest_path", ""):
+            # A directory moved into place produces no events for its contents
+            self.changes.put((event.dest_path, event.is_directory))
+
 
 class FileSync:
-    def __init__(self, source: Path, replica: Path, interval: int, amount: int, log_path: Path, dry_run: bool, ignore: list) -> None:
+    def __init__(self, source: Path, replica: Path, interval: int, amount: int, log_path: Path, dry_run: bool, ignore: list, threads: int = DEFAULT_THREADS, watch: bool = False, processes: int = DEFAULT_PROCESSES) -> None:
         self.source_path = Path(source)
         self.replica_path = Path(replica)
         self.sync_interval = int(interval)
@@ -26,12 +186,51 @@ class FileSync:
         self.log_path = Path(log_path)
         self.dry_run = dry_run
         self.ignore_paths = ignore
+        self.threads = max(1, int(threads))
+        self.watch = watch
+        self.processes = max(1, int(processes))
 
         self.validate_paths()
 
         self.logger = None
+        self._log_listener = None
         self.init_logging()
 
+        self.cache_path = self.replica_path / CACHE_FILE_NAME
+        # A source file at the same place would overwrite the index, so it is never synced
+        self._reserved_source_path = os.path.join(
+            str(self.source_path), CACHE_FILE_NAME)
+        self._replica_prefix = os.path.join(str(self.replica_path), "")
+        self._fp_cache = self.load_fingerprint_cache()
+        self._cache_lock = threading.Lock()
+
+        self._changes = queue.Queue()
+        self._observer = None
+
+        # Replica directories known to exist during the current sync iteration
+        self._created_dirs = set()
+        # Directories that could not be listed during the current sync iteration
+        self._unscanned_dirs = set()
+        # Whether to try reflinks, i.e. source and replica share a device
+        self._try_reflink = False
+        # Whether replica files can be reflinked within the replica to seed patches
+        self._clone_replicas = False
+
+    def __getstate__(self) -> dict:
+        """
+        Pickle support for worker processes: drop locks, queues, threads and the logger
+        """
+        state = self.__dict__.copy()
+        for name in ("logger", "_log_listener", "_cache_lock", "_changes", "_observer"):
+            state[name] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.logger = logging.getLogger(__name__)
+        self._cache_lock = threading.Lock()
+        self._changes = queue.Queue()
+
     @staticmethod
     def add_arguments(parser):
         """
@@ -50,18 +249,57 @@ class FileSync:
             "--ignore", help="Paths to the files to ignore", action="append", default=[])
         parser.add_argument(
             "--dry-run", help="Perform a trial run without making any changes", action="store_true")
+        parser.add_argument(
+            "--threads", help="Number of worker threads used to compare and copy files", type=int, default=DEFAULT_THREADS)
+        parser.add_argument(
+            "--watch", help="Sync only the paths reported by filesystem events between full syncs (requires watchdog)", action="store_true")
+        parser.add_argument(
+            "--processes", help="Number of worker processes for full syncs, each syncing whole top-level subdirectories", type=int, default=DEFAULT_PROCESSES)
 
         return parser.parse_args()
 
     def init_logging(self) -> None:
         """
-        Initialize logging configuration
+        Initialize logging configuration.
+        Records are queued and written to the file and console by a background listener thread,
+        keeping handler I/O out of the sync loop
         """
-        logging.basicConfig(level=logging.INFO,
-                            format='[%(asctime)s] - %(levelname)s: %(message)s',
-                            handlers=[logging.FileHandler(self.log_path), logging.StreamHandler()])
+        handlers = self.create_log_handlers()
+        log_queue = queue.Queue(-1)
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, *handlers)
+        self._log_listener.start()
+        # The queue handler only merges the message with any traceback; the listener's handlers format it
+        logging.basicConfig(level=logging.INFO, format='%(message)s',
+                            handlers=[logging.handlers.QueueHandler(log_queue)])
         self.logger = logging.getLogger(__name__)
 
+    def create_log_handlers(self) -> List[logging.Handler]:
+        """
+        Create the formatted log file and console handlers
+        """
+        formatter = logging.Formatter(
+            '[%(asctime)s] - %(levelname)s: %(message)s')
+        handlers = [logging.FileHandler(self.log_path), logging.StreamHandler()]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        return handlers
+
+    def stop_logging(self) -> None:
+        """
+        Flush queued log records and write any later ones synchronously
+        """
+        if self._log_listener is None:
+            return
+        self._log_listener.stop()
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                root.removeHandler(handler)
+        for handler in self._log_listener.handlers:
+            root.addHandler(handler)
+        self._log_listener = None
+
     def validate_paths(self) -> None:
         """
         Validate source and replica paths, create replica folder and log file in case they do not exist
@@ -82,51 +320,353 @@ class FileSync:
             if not self.dry_run:
                 open(self.log_path, 'w').close()
 
+    def load_fingerprint_cache(self) -> Dict[str, dict]:
+        """
+        Load the (size, mtime_ns, hash) fingerprint index of the replica files
+        """
+        try:
+            with open(self.cache_path, "r") as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(
+                f"Ignoring unreadable fingerprint cache '{self.cache_path}': {e}")
+            return {}
+        if not isinstance(cache, dict) or cache.get("algorithm") != HASH_FORMAT:
+            return {}
+        return cache.get("files", {})
+
+    def save_fingerprint_cache(self) -> None:
+        """
+        Persist the fingerprint index atomically
+        """
+        if self.dry_run:
+            return
+        try:
+            with replacement_file(self.cache_path) as tmp:
+                with open(tmp, "w") as f:
+                    json.dump({"algorithm": HASH_FORMAT,
+                              "files": self._fp_cache}, f)
+        except Exception as e:
+            self.logger.exception(
+                f"Error saving fingerprint cache '{self.cache_path}': {e}")
+
+    def cache_key(self, replica_file: str) -> str:
+        """
+        Key of a replica file in the fingerprint index (path relative to the replica root)
+        """
+        replica_file = os.fspath(replica_file)
+        if replica_file.startswith(self._replica_prefix):
+            rel = replica_file[len(self._replica_prefix):]
+        else:
+            rel = os.path.relpath(replica_file, self.replica_path)
+        return rel.replace(os.sep, "/")
+
+    def forget_fingerprint(self, replica_path: str, recursive: bool = False) -> None:
+        """
+        Drop the cached fingerprint of a replica file, or with recursive, of everything under
+        a replica directory (which scans the whole index)
+        """
+        key = self.cache_key(replica_path)
+        with self._cache_lock:
+            if not recursive:
+                self._fp_cache.pop(key, None)
+                return
+            prefix = key + "/"
+            for cached in [k for k in self._fp_cache if k == key or k.startswith(prefix)]:
+                del self._fp_cache[cached]
+
     def calculate_file_hash(self, file_path: Path) -> str:
         """
-        Calculate the MD5 hash of a file for file comparison
+        Calculate the composite SHA-256 hash of a file (see HASH_FORMAT) for file comparison.
+        Ranges of large files are hashed on separate threads; hashlib releases the GIL while hashing
         """
-        hash_md5 = hashlib.md5()
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
+            size = os.path.getsize(file_path)
+            offsets = range(0, size, HASH_RANGE_SIZE)
+            if len(offsets) > 1:
+                with ThreadPoolExecutor(max_workers=HASH_THREADS) as executor:
+                    range_digests = list(executor.map(
+                        lambda offset: self.hash_file_range(file_path, offset), offsets))
+            else:
+                range_digests = [self.hash_file_range(
+                    file_path, offset) for offset in offsets]
         except Exception as e:
             self.logger.exception(
                 f"Error calculating hash for {file_path}: {e}")
             return ""
-        return hash_md5.hexdigest()
+        return hashlib.new(HASH_ALGORITHM, b"".join(range_digests)).hexdigest()
 
-    def are_files_different(self, source_file: Path, replica_file: Path) -> bool:
+    def hash_file_range(self, file_path: Path, offset: int) -> bytes:
         """
-        Check if the files are different
+        Hash the HASH_RANGE_SIZE bytes of a file starting at offset, through its own file descriptor.
+        hashlib.file_digest (Python 3.11+) uses OpenSSL's SHA-NI path for whole single-range files
         """
-        try:
-            source_stat = os.stat(source_file)
-            replica_stat = os.stat(replica_file)
-        except FileNotFoundError:
-            return True
+        with open(file_path, "rb", buffering=0) as f, sequential_read(f, offset=offset, length=HASH_RANGE_SIZE):
+            if offset == 0 and hasattr(hashlib, "file_digest") and os.fstat(f.fileno()).st_size <= HASH_RANGE_SIZE:
+                return hashlib.file_digest(f, HASH_ALGORITHM).digest()
+            f.seek(offset)
+            range_hash = hashlib.new(HASH_ALGORITHM)
+            remaining = HASH_RANGE_SIZE
+            while remaining:
+                chunk = f.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                range_hash.update(chunk)
+                remaining -= len(chunk)
+        return range_hash.digest()
 
-        if source_stat.st_size != replica_stat.st_size:
-            return True
-        if int(source_stat.st_mtime) == replica_stat.st_mtime:
-            return False
+    def sync_file(self, source_file: str, replica_file: str, source_stat: os.stat_result, replica_stat: Optional[os.stat_result]) -> Optional[bool]:
+        """
+        Bring a replica file up to date with its source.
+        Contents are only read when the sizes match but the mtimes do not. If the fingerprint
+        index holds the replica hash for its current (size, mtime_ns), only the source is hashed;
+        otherwise both files are compared and, if needed, copied in a single streamed pass.
+        replica_stat is an lstat result, None if the replica file does not exist; non-regular
+        replicas (e.g. symlinks) are always replaced by a full copy.
+        Returns True if the replica was rewritten, False if it was up to date, None if copying failed
+        """
+        if replica_stat is not None and stat.S_ISREG(replica_stat.st_mode) and source_stat.st_size == replica_stat.st_size:
+            if source_stat.st_mtime_ns == replica_stat.st_mtime_ns:
+                return False
 
-        if not replica_file.exists():
+            entry = self._fp_cache.get(self.cache_key(replica_file))
+            if not (entry and entry.get("size") == replica_stat.st_size and entry.get("mtime_ns") == replica_stat.st_mtime_ns):
+                return self.compare_and_maybe_copy(source_file, replica_file, source_stat, replica_stat)
+            if self.calculate_file_hash(source_file) == entry["hash"]:
+                self.record_unchanged(
+                    replica_file, source_stat, replica_stat, entry["hash"])
+                return False
+
+        return True if self.copy_file(source_file, replica_file, source_stat, replica_stat) else None
+
+    def record_unchanged(self, replica_file: str, source_stat: os.stat_result, replica_stat: os.stat_result, file_hash: str) -> None:
+        """
+        Record a replica file whose contents match the source despite a different mtime.
+        The source mtime is copied over so later passes take the (size, mtime_ns) fast path,
+        and the hash is cached for filesystems whose timestamps cannot hold it exactly
+        """
+        if not self.dry_run and source_stat.st_mtime_ns != replica_stat.st_mtime_ns:
+            try:
+                os.utime(replica_file, ns=(replica_stat.st_atime_ns,
+                                           source_stat.st_mtime_ns))
+                replica_stat = os.stat(replica_file)
+            except OSError as e:
+                self.logger.warning(
+                    f"Cannot update timestamps of '{replica_file}': {e}")
+        with self._cache_lock:
+            self._fp_cache[self.cache_key(replica_file)] = {"size": replica_stat.st_size,
+                                                            "mtime_ns": replica_stat.st_mtime_ns,
+                                                            "hash": file_hash}
+
+    def compare_and_maybe_copy(self, source_file: str, replica_file: str, source_stat: os.stat_result, replica_stat: os.stat_result) -> bool:
+        """
+        Compare two files of the same size chunk by chunk and, from the first difference on,
+        stream the rest of the source into the replica, so the source is read only once.
+        Large replicas are reflinked where possible, otherwise patched from that offset.
+        Returns True if the replica was rewritten
+        """
+        file_hash = RangeHash()
+        offset = 0
+        with open(source_file, "rb") as src, open(replica_file, "rb") as rep, sequential_read(src, rep):
+            while True:
+                chunk = src.read(CHUNK_SIZE)
+                if chunk != rep.read(CHUNK_SIZE):
+                    break
+                if not chunk:
+                    self.record_unchanged(
+                        replica_file, source_stat, replica_stat, file_hash.hexdigest())
+                    return False
+                file_hash.update(chunk)
+                offset += len(chunk)
+
+            if self.dry_run:
+                self.logger.info(f"Copied '{source_file}' to '{replica_file}'")
+                return True
+
+            if replica_stat.st_size <= DELTA_THRESHOLD:
+                with replacement_file(replica_file) as tmp:
+                    with open(tmp, "wb") as dst:
+                        if offset:
+                            src.seek(0)
+                        else:
+                            dst.write(chunk)
+                        shutil.copyfileobj(src, dst, CHUNK_SIZE)
+                    self.copy_metadata(tmp, source_stat)
+                self.forget_fingerprint(replica_file)
+                self.logger.info(f"Copied '{source_file}' to '{replica_file}'")
+                return True
+
+        if self._try_reflink:
+            self.replace_file(source_file, replica_file, source_stat)
+            self.logger.info(f"Copied '{source_file}' to '{replica_file}'")
             return True
 
-        return self.calculate_file_hash(source_file) != self.calculate_file_hash(replica_file)
+        written = self.patch_file(
+            source_file, replica_file, source_stat, replica_stat, offset)
+        self.forget_fingerprint(replica_file)
+        self.log_patch(source_file, replica_file, written)
+        return True
+
+    def patch_file(self, source_file: str, replica_file: str, source_stat: os.stat_result, replica_stat: os.stat_result, offset: int = 0) -> Optional[int]:
+        """
+        Update a regular replica file through a temporary reflink of the replica, rewriting only
+        the blocks that differ from the source (from offset on), then atomically replace the replica.
+        Returns the number of bytes written, or None if the replica filesystem cannot clone files
+        and the source was copied in full instead, as seeding a plain copy costs more than that
+        """
+        written = 0
+        with replacement_file(replica_file) as tmp:
+            if self._clone_replicas and not self.clone_file(replica_file, tmp):
+                self._clone_replicas = False
+            if not self._clone_replicas:
+                self.copy_file_data(source_file, tmp, source_stat.st_size)
+                self.copy_metadata(tmp, source_stat)
+                return None
+            with open(source_file, "rb") as src, open(replica_file, "rb") as rep, open(tmp, "r+b") as dst, sequential_read(src, rep, offset=offset):
+                src.seek(offset)
+                rep.seek(offset)
+                while True:
+                    chunk = src.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    current = rep.read(len(chunk))
+                    if current != chunk:
+                        for start in range(0, len(chunk), DELTA_BLOCK_SIZE):
+                            block = chunk[start:start + DELTA_BLOCK_SIZE]
+                            if current[start:start + DELTA_BLOCK_SIZE] != block:
+                                dst.seek(offset + start)
+                                dst.write(block)
+                                written += len(block)
+                    offset += len(chunk)
+                dst.truncate(offset)
+            self.copy_metadata(tmp, source_stat)
+        return written
+
+    def log_patch(self, source_file: str, replica_file: str, written: Optional[int]) -> None:
+        """
+        Log the outcome of patch_file
+        """
+        if written is None:
+            self.logger.info(f"Copied '{source_file}' to '{replica_file}'")
+        else:
+            self.logger.info(
+                f"Patched '{replica_file}' from '{source_file}' ({written} bytes written)")
+
+    def copy_metadata(self, target_file: str, source_stat: os.stat_result) -> None:
+        """
+        Apply the permission bits and timestamps of the already stat'ed source to a file
+        """
+        os.chmod(target_file, stat.S_IMODE(source_stat.st_mode))
+        os.utime(target_file, ns=(source_stat.st_atime_ns,
+                                  source_stat.st_mtime_ns))
+
+    def copy_file_direct(self, source_file: str, target_file: str) -> None:
+        """
+        Copy file contents with O_DIRECT through a page-aligned buffer, bypassing the page cache.
+        Raises OSError with EINVAL where the filesystem does not support direct I/O
+        """
+        buf = mmap.mmap(-1, DIRECT_IO_CHUNK_SIZE)
+        try:
+            with memoryview(buf) as view:
+                src_fd = os.open(source_file, os.O_RDONLY | os.O_DIRECT)
+                try:
+                    dst_fd = os.open(target_file, os.O_WRONLY | os.O_CREAT |
+                                     os.O_TRUNC | os.O_DIRECT, 0o666)
+                    try:
+                        size = 0
+                        while True:
+                            read = os.readv(src_fd, [buf])
+                            if not read:
+                                break
+                            size += read
+                            # Direct writes must be block aligned, so a short tail is padded and truncated below
+                            length = -(-read // DIRECT_IO_ALIGNMENT) * \
+                                DIRECT_IO_ALIGNMENT
+                            written = 0
+                            while written < length:
+                                written += os.writev(dst_fd,
+                                                     [view[written:length]])
+                            if read % DIRECT_IO_ALIGNMENT:
+                                break
+                        os.ftruncate(dst_fd, size)
+                    finally:
+                        os.close(dst_fd)
+                finally:
+                    os.close(src_fd)
+        finally:
+            buf.close()
+
+    def clone_file(self, source_file: str, target_file: str) -> bool:
+        """
+        Create the target as a reflink (copy-on-write clone) of the source with ioctl(FICLONE).
+        Returns False if the filesystem does not support it
+        """
+        with open(source_file, "rb") as src, open(target_file, "wb") as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                return True
+            except OSError as e:
+                if e.errno not in REFLINK_FALLBACK_ERRNOS:
+                    raise
+        return False
 
-    def copy_file(self, source_file: Path, replica_file: Path) -> bool:
+    def copy_file_data(self, source_file: str, target_file: str, source_size: int) -> None:
         """
-        Copy a file from one location to another using shutil library
+        Copy file contents in the kernel with os.copy_file_range (Linux), which also lets
+        the filesystem use reflinks or server-side copies; fall back to a buffered copy.
+        Files on the same device as the source are reflinked where supported, and files
+        above DIRECT_IO_THRESHOLD are copied with O_DIRECT where supported
+        """
+        if self._try_reflink:
+            if self.clone_file(source_file, target_file):
+                return
+            # Stop trying for this iteration
+            self._try_reflink = False
+
+        if source_size > DIRECT_IO_THRESHOLD and hasattr(os, "O_DIRECT"):
+            try:
+                self.copy_file_direct(source_file, target_file)
+                return
+            except OSError as e:
+                if e.errno != errno.EINVAL:
+                    raise
+
+        with open(source_file, "rb") as src, open(target_file, "wb") as dst, sequential_read(src):
+            if hasattr(os, "copy_file_range"):
+                try:
+                    while os.copy_file_range(src.fileno(), dst.fileno(), COPY_RANGE_SIZE):
+                        pass
+                    return
+                except OSError as e:
+                    if e.errno not in COPY_RANGE_FALLBACK_ERRNOS:
+                        raise
+                    src.seek(0)
+                    dst.seek(0)
+                    dst.truncate()
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+
+    def copy_file(self, source_file: str, replica_file: str, source_stat: os.stat_result, replica_stat: Optional[os.stat_result]) -> bool:
+        """
+        Copy a file from one location to another through a temporary file.
+        Large files that already exist in the replica as regular files are patched instead,
+        unless they can be reflinked, which costs no data reads.
+        Takes the stat results of both files (replica_stat is an lstat result, None if it does not exist)
         """
         try:
-            tmp = replica_file.with_suffix('.tmp')
             if not self.dry_run:
-                replica_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(source_file, tmp)
-                os.replace(tmp, replica_file)
+                if replica_stat is not None and stat.S_ISREG(replica_stat.st_mode) and source_stat.st_size > DELTA_THRESHOLD and not self._try_reflink:
+                    written = self.patch_file(
+                        source_file, replica_file, source_stat, replica_stat)
+                    self.forget_fingerprint(replica_file)
+                    self.log_patch(source_file, replica_file, written)
+                    return True
+                parent = os.path.dirname(replica_file)
+                if parent not in self._created_dirs:
+                    os.makedirs(parent, exist_ok=True)
+                    self._created_dirs.add(parent)
+                self.replace_file(source_file, replica_file, source_stat)
             self.logger.info(f"Copied '{source_file}' to '{replica_file}'")
             return True
         except Exception as e:
@@ -134,19 +674,32 @@ class FileSync:
                 f"Error copying file from {source_file} to {replica_file}: {e}")
             return False
 
-    def remove_file_or_directory(self, path: Path) -> None:
+    def replace_file(self, source_file: str, replica_file: str, source_stat: os.stat_result) -> None:
+        """
+        Copy the source into a temporary file next to the replica and atomically replace the replica with it
+        """
+        with replacement_file(replica_file) as tmp:
+            self.copy_file_data(source_file, tmp, source_stat.st_size)
+            self.copy_metadata(tmp, source_stat)
+        self.forget_fingerprint(replica_file)
+
+    def remove_file_or_directory(self, path: Union[Path, str]) -> None:
         """
         Remove file/directory from the location
         """
         try:
-            if path.is_file():
+            is_dir = False
+            if os.path.isfile(path):
                 self.logger.warning(f"Removed '{path}'")
                 if not self.dry_run:
-                    path.unlink()
-            if path.is_dir():
+                    os.unlink(path)
+            if os.path.isdir(path):
+                is_dir = True
                 self.logger.warning(f"Removed directory '{path}'")
                 if not self.dry_run:
                     shutil.rmtree(path)
+            if not self.dry_run:
+                self.forget_fingerprint(path, recursive=is_dir)
         except PermissionError as e:
             self.logger.exception(f"Permission error removing {path}: {e}")
         except Exception as e:
@@ -157,108 +710,411 @@ class FileSync:
         Start the synchronization process
         """
         self.logger.info("Starting synchronization...")
+        if self.watch:
+            self.start_watching()
+
+        try:
+            for i in range(self.sync_amount):
+                self.logger.info(f"Sync iteration {i+1} started.")
 
-        for i in range(self.sync_amount):
-            self.logger.info(f"Sync iteration {i+1} started.")
+                # Initialize counters for each sync iteration
+                files_copied = files_removed = 0
+                dirs_created = dirs_removed = 0
+                errors = 0
 
-            # Initialize counters for each sync iteration
-            files_copied = files_removed = 0
-            dirs_created = dirs_removed = 0
-            errors = 0
+                sync_start_time = time.time()
+                if not os.path.isdir(self.replica_path):
+                    # The replica root may have been removed since the last iteration
+                    if not self.dry_run:
+                        os.makedirs(self.replica_path, exist_ok=True)
+                    self.logger.info(
+                        f"Created directory '{self.replica_path}'")
+                self._created_dirs = {str(self.replica_path)}
+                self._unscanned_dirs = set()
+                # A dry run leaves a missing replica root missing
+                self._try_reflink = fcntl is not None and os.path.isdir(self.replica_path) and os.stat(
+                    self.source_path).st_dev == os.stat(self.replica_path).st_dev
+                self._clone_replicas = fcntl is not None
 
-            sync_start_time = time.time()
+                source_root = Path(self.source_path)
+                replica_root = Path(self.replica_path)
 
-            source_root = Path(self.source_path)
-            replica_root = Path(self.replica_path)
+                if self._observer is not None and i % FULL_SYNC_EVERY != 0:
+                    files_copied, dirs_created, errors, files_removed, dirs_removed = self.sync_changes(
+                        source_root, replica_root)
+                elif self.processes > 1:
+                    self.drain_changes()
+                    files_copied, dirs_created, errors, files_removed, dirs_removed = self.sync_with_processes(
+                        source_root, replica_root)
+                else:
+                    self.drain_changes()
+                    source_inventory = self.scan_inventory(
+                        source_root, skip=self.is_ignored)
+                    replica_inventory = self.scan_inventory(
+                        replica_root, skip=lambda entry: entry.name in self.ignore_paths) if os.path.isdir(replica_root) else {}
+                    replica_inventory.pop(CACHE_FILE_NAME, None)
 
-            files_copied, dirs_created, errors = self.sync_source_to_replica(
-                source_root, replica_root)
-            files_removed, dirs_removed = self.clean_replica(
-                source_root, replica_root)
+                    files_removed, dirs_removed = self.clean_replica(
+                        source_root, replica_root, source_inventory, replica_inventory)
+                    files_copied, dirs_created, errors = self.sync_source_to_replica(
+                        source_root, replica_root, source_inventory, replica_inventory)
+                self.save_fingerprint_cache()
 
-            self.log_sync_info(files_copied, files_removed,
-                               dirs_created, dirs_removed, errors, time.time() - sync_start_time)
+                self.log_sync_info(files_copied, files_removed,
+                                   dirs_created, dirs_removed, errors, time.time() - sync_start_time)
 
-            if i < self.sync_amount - 1:
-                self.logger.info(
-                    f"Waiting for {self.sync_interval} seconds until next synchronization...")
-                time.sleep(self.sync_interval)
+                if i < self.sync_amount - 1:
+                    self.logger.info(
+                        f"Waiting for {self.sync_interval} seconds until next synchronization...")
+                    time.sleep(self.sync_interval)
+        finally:
+            self.stop_watching()
+            self.stop_logging()
 
-    def sync_source_to_replica(self, source_root: Path, replica_root: Path) -> Tuple[int, int, int]:
+    def sync_with_processes(self, source_root: Path, replica_root: Path) -> Tuple[int, int, int, int, int]:
         """
-        Synchronize files from the source directory to the replica directory
+        Full synchronization with each top-level source subdirectory synced and cleaned by a
+        worker process, which escapes the GIL for CPU-bound hashing. Top-level entries are
+        handled in this process, so workers never touch the same paths
         """
-        dirs_created = files_copied = errors = 0
+        with os.scandir(source_root) as it:
+            source_top = {entry.name: entry for entry in it
+                          if not self.is_ignored(entry)}
+        with os.scandir(replica_root) if os.path.isdir(replica_root) else contextlib.nullcontext([]) as it:
+            replica_top = {entry.name: entry for entry in it
+                           if entry.name not in self.ignore_paths and entry.name != CACHE_FILE_NAME}
 
-        for root, dirs, files in os.walk(source_root):
-            root_path = Path(root)
-            replica_dir_path = replica_root / \
-                root_path.relative_to(source_root)
-            if not self.dry_run:
-                os.makedirs(replica_dir_path, exist_ok=True)
+        # The top-level inventories do not list the contents of stale directories, count them first
+        files_removed = dirs_removed = 0
+        for name, entry in replica_top.items():
+            source_entry = source_top.get(name)
+            if entry.is_dir() and not entry.is_symlink() and (source_entry is None or not source_entry.is_dir()):
+                for _, sub in self.scan_tree(entry.path, skip=lambda sub: sub.name in self.ignore_paths):
+                    if sub.is_dir() and not sub.is_symlink():
+                        dirs_removed += 1
+                    else:
+                        files_removed += 1
+        # Entries that changed between file and directory must be removed before planning
+        removed_files, removed_dirs = self.clean_replica(
+            source_root, replica_root, source_top, replica_top)
+        files_removed += removed_files
+        dirs_removed += removed_dirs
 
-            for name in files:
-                source_file = root_path / name
-                replica_file = replica_dir_path / name
+        pairs, dirs_created = self.plan_source_tree(
+            source_root, replica_root, source_top, replica_top)
+        subtrees = [(entry.path, os.path.join(replica_root, name)) for name, entry in source_top.items()
+                    if entry.is_dir() and not entry.is_symlink()]
 
-                if name in self.ignore_paths:
-                    self.logger.info(
-                        f"Ignoring file: '{replica_file}'")
-                    continue
+        if not subtrees:
+            files_copied, errors = self.copy_files(pairs)
+            return files_copied, dirs_created, errors, files_removed, dirs_removed
 
-                if self.are_files_different(source_file, replica_file):
-                    if self.copy_file(source_file, replica_file):
-                        files_copied += 1
-                    else:
-                        errors += 1
-                        self.logger.error(
-                            f"Error copying file from {source_file} to {replica_file}")
-                else:
-                    self.logger.info(
-                        f"Skipping unchanged file: '{replica_file}'")
-            for name in dirs:
-                source_dir = root_path / name
-                replica_dir = replica_dir_path / name
+        with multiprocessing.Pool(min(self.processes, len(subtrees)), initializer=_init_worker, initargs=(self,)) as pool:
+            pending = pool.starmap_async(_sync_subtree, subtrees)
+            files_copied, errors = self.copy_files(pairs)
+            results = pending.get()
 
-                if name in self.ignore_paths:
-                    self.logger.info(
-                        f"Ignoring directory: '{source_dir}'")
-                    continue
+        for (_, replica_dir), (copied, created, failed, removed_files, removed_dirs, cache) in zip(subtrees, results):
+            files_copied += copied
+            dirs_created += created
+            errors += failed
+            files_removed += removed_files
+            dirs_removed += removed_dirs
+            self.forget_fingerprint(replica_dir, recursive=True)
+            with self._cache_lock:
+                self._fp_cache.update(cache)
+
+        return files_copied, dirs_created, errors, files_removed, dirs_removed
+
+    def start_watching(self) -> None:
+        """
+        Start collecting filesystem events for the source directory.
+        Falls back to full syncs if watchdog is missing or the watch cannot be set up
+        (e.g. fs.inotify.max_user_watches exceeded)
+        """
+        if Observer is None:
+            self.logger.warning(
+                "watchdog is not installed, falling back to full synchronization")
+            return
+        observer = Observer()
+        try:
+            observer.schedule(ChangeCollector(self._changes),
+                              os.path.abspath(self.source_path), recursive=True)
+            observer.start()
+        except OSError as e:
+            self.logger.warning(
+                f"Cannot watch '{self.source_path}', falling back to full synchronization: {e}")
+            return
+        self._observer = observer
+
+    def stop_watching(self) -> None:
+        """
+        Stop the filesystem event observer, if any
+        """
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
 
-                if not replica_dir.exists():
+    def drain_changes(self) -> List[Tuple[str, bool]]:
+        """
+        Return the (path, rescan) pairs of source paths changed since the last call, parents before children
+        """
+        changed = {}
+        while True:
+            try:
+                path, rescan = self._changes.get_nowait()
+            except queue.Empty:
+                return sorted(changed.items())
+            changed[path] = changed.get(path, False) or rescan
+
+    def sync_changes(self, source_root: Path, replica_root: Path) -> Tuple[int, int, int, int, int]:
+        """
+        Synchronize only the source paths reported by filesystem events
+        """
+        files_removed = dirs_removed = dirs_created = 0
+        # Keyed by replica path so a file reported by several events is copied by one thread only
+        pairs = {}
+        # Event paths are under the absolute watched path; map them by prefix, not per-path relpath
+        source_prefix = os.path.join(os.path.abspath(source_root), "")
+        replica_prefix = os.path.join(replica_root, "")
+
+        for path, rescan in self.drain_changes():
+            if not path.startswith(source_prefix):
+                continue
+            rel = path[len(source_prefix):]
+            if rel == CACHE_FILE_NAME or any(part in self.ignore_paths for part in rel.split(os.sep)):
+                continue
+
+            replica_path = replica_prefix + rel
+            is_dir = os.path.isdir(path) and not os.path.islink(path)
+            exists = is_dir or os.path.exists(path)
+            # Remove the replica of a deleted path, or of one that changed between file and directory
+            if os.path.lexists(replica_path) and (not exists or is_dir != os.path.isdir(replica_path)):
+                if os.path.isdir(replica_path) and not os.path.islink(replica_path):
+                    dirs_removed += 1
+                else:
+                    files_removed += 1
+                self.remove_file_or_directory(replica_path)
+
+            if is_dir:
+                if not os.path.exists(replica_path):
                     if not self.dry_run:
-                        replica_dir.mkdir(parents=True, exist_ok=True)
-                    self.logger.info(f"Created directory '{replica_dir}'")
+                        os.makedirs(replica_path, exist_ok=True)
+                    self.logger.info(f"Created directory '{replica_path}'")
                     dirs_created += 1
+                self._created_dirs.add(replica_path)
+                if rescan:
+                    # A directory moved into place may replace one with other contents
+                    source_inventory = self.scan_inventory(
+                        path, skip=self.is_ignored)
+                    replica_inventory = self.scan_inventory(
+                        replica_path, skip=lambda entry: entry.name in self.ignore_paths) if os.path.isdir(replica_path) else {}
+                    removed_files, removed_dirs = self.clean_replica(
+                        path, replica_path, source_inventory, replica_inventory)
+                    files_removed += removed_files
+                    dirs_removed += removed_dirs
+                    subtree_pairs, subtree_dirs = self.plan_source_tree(
+                        path, replica_path, source_inventory, replica_inventory)
+                    for source, replica in subtree_pairs:
+                        pairs.setdefault(
+                            os.fspath(getattr(replica, "path", replica)), (source, replica))
+                    dirs_created += subtree_dirs
+            elif exists:
+                pairs.setdefault(replica_path, (path, replica_path))
+
+        files_copied, errors = self.copy_files(list(pairs.values()))
+        return files_copied, dirs_created, errors, files_removed, dirs_removed
 
+    def scan_tree(self, path: Path, prefix: str = "", skip: Optional[Callable[[os.DirEntry], bool]] = None) -> Iterator[Tuple[str, os.DirEntry]]:
+        """
+        Recursively yield (relative path, entry) pairs of a directory tree, parents before children.
+        Entries accepted by skip are neither yielded nor descended into. Directories that cannot
+        be listed (unreadable, or removed during the scan) are logged, recorded and skipped
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError as e:
+            self.logger.error(f"Error scanning directory '{path}': {e}")
+            self._unscanned_dirs.add(os.fspath(path))
+            return
+        for entry in entries:
+            if skip is not None and skip(entry):
+                continue
+            rel = prefix + entry.name
+            yield rel, entry
+            if entry.is_dir() and not entry.is_symlink():
+                yield from self.scan_tree(entry.path, rel + os.sep, skip)
+
+    def is_ignored(self, entry: os.DirEntry) -> bool:
+        """
+        Check if a source entry is excluded from synchronization
+        """
+        if entry.path == self._reserved_source_path:
+            self.logger.warning(
+                f"Skipping '{entry.path}': the name is reserved for the replica's fingerprint cache")
+            return True
+        if entry.name not in self.ignore_paths:
+            return False
+        if entry.is_dir():
+            self.logger.info(f"Ignoring directory: '{entry.path}'")
+        else:
+            self.logger.info(f"Ignoring file: '{entry.path}'")
+        return True
+
+    def scan_inventory(self, root: Union[Path, str], skip: Optional[Callable[[os.DirEntry], bool]] = None) -> Dict[str, os.DirEntry]:
+        """
+        Map the relative path of every entry of a directory tree to its os.DirEntry, in walk order
+        """
+        return dict(self.scan_tree(root, skip=skip))
+
+    def sync_source_to_replica(self, source_root: Path, replica_root: Path, source_inventory: Optional[Dict[str, os.DirEntry]] = None, replica_inventory: Optional[Dict[str, os.DirEntry]] = None) -> Tuple[int, int, int]:
+        """
+        Synchronize files from the source directory to the replica directory
+        """
+        pairs, dirs_created = self.plan_source_tree(
+            source_root, replica_root, source_inventory, replica_inventory)
+        files_copied, errors = self.copy_files(pairs)
         return files_copied, dirs_created, errors
 
-    def clean_replica(self, source_root: Path, replica_root: Path) -> Tuple[int, int]:
+    def plan_source_tree(self, source_dir: Union[Path, str], replica_dir: Union[Path, str], source_inventory: Optional[Dict[str, os.DirEntry]] = None, replica_inventory: Optional[Dict[str, os.DirEntry]] = None) -> Tuple[List[tuple], int]:
         """
-        Remove files/directories in the replica folder that no longer exist in the source
+        Create the missing replica directories of a source tree in walk order and
+        return the (source, replica) file pairs to compare, with the number of created directories.
+        Inventories from scan_inventory are built when not given
         """
-        files_removed = dirs_removed = 0
-        for root, dirs, files in os.walk(replica_root, topdown=False):
-            root_path = Path(root)
-            source_dir_path = source_root / \
-                root_path.relative_to(replica_root)
-            for name in files:
-                replica_path = root_path / name
-                source_path = source_dir_path / name
-
-                if not source_path.exists():
+        if source_inventory is None:
+            source_inventory = self.scan_inventory(
+                source_dir, skip=self.is_ignored)
+        if replica_inventory is None:
+            replica_inventory = self.scan_inventory(replica_dir) if os.path.isdir(
+                replica_dir) else {}
+
+        dirs_created = 0
+        pairs = []
+        replica_prefix = os.path.join(replica_dir, "")
+
+        for rel, entry in source_inventory.items():
+            replica_entry = replica_inventory.get(rel)
+            replica_path = replica_prefix + rel
+            if entry.is_dir():
+                if replica_entry is None:
+                    # Parents come first in the inventory, so a single mkdir is enough
                     if not self.dry_run:
-                        self.remove_file_or_directory(replica_path)
-                    files_removed += 1
+                        try:
+                            os.mkdir(replica_path)
+                        except FileExistsError:
+                            pass
+                    self.logger.info(f"Created directory '{replica_path}'")
+                    dirs_created += 1
+                self._created_dirs.add(replica_path)
+            else:
+                pairs.append((entry, replica_entry or replica_path))
 
-            for name in dirs:
-                replica_path = root_path / name
-                source_path = source_dir_path / name
+        return pairs, dirs_created
 
-                if not source_path.exists():
-                    self.remove_file_or_directory(replica_path)
+    def copy_files(self, pairs: List[tuple]) -> Tuple[int, int]:
+        """
+        Compare and copy files concurrently, return (files copied, errors)
+        """
+        files_copied = errors = 0
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            for copied, error in executor.map(lambda pair: self._sync_one(*pair), pairs):
+                files_copied += copied
+                errors += error
+        return files_copied, errors
+
+    def _sync_one(self, source: Union[os.DirEntry, str], replica: Union[os.DirEntry, Path, str]) -> Tuple[bool, bool]:
+        """
+        Copy a single file if it differs from its replica, return (copied, error).
+        Both sides are either a scanned os.DirEntry, whose stat result is reused, or a path
+        """
+        source_file = getattr(source, "path", source)
+        replica_file = os.fspath(getattr(replica, "path", replica))
+        try:
+            source_stat = source.stat() if isinstance(
+                source, os.DirEntry) else os.stat(source_file)
+            try:
+                # Not following symlinks: a linked replica is replaced, never written through
+                replica_stat = replica.stat(follow_symlinks=False) if isinstance(
+                    replica, os.DirEntry) else os.lstat(replica_file)
+            except FileNotFoundError:
+                replica_stat = None
+            copied = self.sync_file(
+                source_file, replica_file, source_stat, replica_stat)
+        except Exception as e:
+            self.logger.exception(
+                f"Error synchronizing {source_file} to {replica_file}: {e}")
+            copied = None
+        if copied is False:
+            self.logger.info(f"Skipping unchanged file: '{replica_file}'")
+            return False, False
+        if copied:
+            return True, False
+        self.logger.error(
+            f"Error copying file from {source_file} to {replica_file}")
+        return False, True
+
+    def clean_replica(self, source_root: Path, replica_root: Path, source_inventory: Optional[Dict[str, os.DirEntry]] = None, replica_inventory: Optional[Dict[str, os.DirEntry]] = None) -> Tuple[int, int]:
+        """
+        Remove files/directories in the replica folder that no longer exist in the source,
+        or that changed between file and directory. Stale paths are the replica inventory entries
+        missing from the source inventory or of the other kind; a stale directory is removed with
+        a single rmtree. Entries of the other kind are dropped from replica_inventory, so running
+        this before plan_source_tree lets it recreate them
+        """
+        if source_inventory is None:
+            source_inventory = self.scan_inventory(
+                source_root, skip=self.is_ignored)
+        if replica_inventory is None:
+            replica_inventory = self.scan_inventory(
+                replica_root, skip=lambda entry: entry.name in self.ignore_paths) if os.path.isdir(replica_root) else {}
+            replica_inventory.pop(CACHE_FILE_NAME, None)
+
+        if os.fspath(source_root) in self._unscanned_dirs:
+            return 0, 0
+        # The replica contents of source directories that could not be listed are kept as they are
+        unscanned = tuple(rel + os.sep for rel, entry in source_inventory.items()
+                          if entry.path in self._unscanned_dirs)
+        stale = set()
+        retyped = []
+        for rel, entry in replica_inventory.items():
+            source_entry = source_inventory.get(rel)
+            if source_entry is None:
+                if not rel.startswith(unscanned):
+                    stale.add(rel)
+            elif source_entry.is_dir() != entry.is_dir():
+                stale.add(rel)
+                retyped.append(rel)
+        files_removed = dirs_removed = 0
+        removed_prefix = None
+        # The scan lists a directory's contents right after it, so only the topmost stale
+        # directory of a subtree is removed; its descendants are just counted
+        for rel, entry in replica_inventory.items():
+            is_dir = entry.is_dir() and not entry.is_symlink()
+            if removed_prefix is not None and rel.startswith(removed_prefix):
+                if is_dir:
                     dirs_removed += 1
+                else:
+                    files_removed += 1
+                continue
+            removed_prefix = None
+            if rel not in stale:
+                continue
+            replica_path = entry.path
+
+            if is_dir:
+                self.remove_file_or_directory(replica_path)
+                dirs_removed += 1
+                removed_prefix = rel + os.sep
+            else:
+                if not self.dry_run:
+                    self.remove_file_or_directory(replica_path)
+                files_removed += 1
 
+        for rel in retyped:
+            del replica_inventory[rel]
         return files_removed, dirs_removed
 
     def log_sync_info(self, files_copied: int, files_removed: int, dirs_created: int, dirs_removed: int, errors: int, duration: float) -> None:
@@ -268,6 +1124,45 @@ class FileSync:
             f"Synchronization completed in {duration:.3f} seconds")
 
 
+# FileSync instance of a worker process, set by _init_worker
+_worker_syncer = None
+
+
+def _init_worker(syncer: FileSync) -> None:
+    """
+    Worker process initializer: log directly to the file and console, and keep the syncer
+    """
+    global _worker_syncer
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in syncer.create_log_handlers():
+        root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    _worker_syncer = syncer
+
+
+def _sync_subtree(source_dir: str, replica_dir: str) -> Tuple[int, int, int, int, int, Dict[str, dict]]:
+    """
+    Worker process task: sync and clean one top-level subtree. Returns its counters
+    and the fingerprint cache entries under the subtree
+    """
+    syncer = _worker_syncer
+    # Walk each side once and share the inventories between planning and cleaning
+    source_inventory = syncer.scan_inventory(source_dir, skip=syncer.is_ignored)
+    replica_inventory = syncer.scan_inventory(
+        replica_dir, skip=lambda entry: entry.name in syncer.ignore_paths) if os.path.isdir(replica_dir) else {}
+    files_removed, dirs_removed = syncer.clean_replica(
+        source_dir, replica_dir, source_inventory, replica_inventory)
+    pairs, dirs_created = syncer.plan_source_tree(
+        source_dir, replica_dir, source_inventory, replica_inventory)
+    files_copied, errors = syncer.copy_files(pairs)
+    prefix = syncer.cache_key(replica_dir) + "/"
+    cache = {key: entry for key, entry in syncer._fp_cache.items()
+             if key.startswith(prefix)}
+    return files_copied, dirs_created, errors, files_removed, dirs_removed, cache
+
+
 def main() -> None:
     """
     Main function to start the synchronization process
@@ -277,7 +1172,8 @@ def main() -> None:
 
     try:
         syncer = FileSync(args.source_path, args.replica_path,
-                          args.sync_interval, args.sync_amount, args.log_path, dry_run=args.dry_run, ignore=args.ignore)
+                          args.sync_interval, args.sync_amount, args.log_path, dry_run=args.dry_run, ignore=args.ignore,
+                          threads=args.threads, watch=args.watch, processes=args.processes)
         syncer.sync()
 
     except Exception: